@@ -15,6 +15,36 @@ import re
 import sys
 from cchooks import create_context, PreToolUseContext
 
+# Only block rm -rf targeting dangerous system paths: / (and /*), ~, $HOME,
+# . (and ..) or *. One alternation, so the command is scanned once; $home is
+# lowercase because commands are lowercased before matching
+DANGEROUS_RM_RE = re.compile(r'\brm\s+.*-[a-z]*r[a-z]*f\s+(?:/|~|\$home|\.|\*)')
+
+# Pattern to detect .env file access (but allow .env.sample): .env right after a
+# word character (config.env), or after cat/touch/cp/mv or an echo redirect
+ENV_FILE_RE = re.compile(r'(?:\b|(?:cat|touch|cp|mv)\s+.*|echo\s+.*>\s*)\.env\b(?!\.sample)')
+
+# Tools that take a file_path, and the subset that writes code
+FILE_TOOLS = frozenset({'Read', 'Edit', 'MultiEdit', 'Write'})
+CODE_TOOLS = frozenset({'Edit', 'MultiEdit', 'Write'})
+
+# File types that get the coding standards reminder
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
+CODING_STANDARDS_REMINDER = """\
+📝 CODING STANDARDS REMINDER:
+   • FUNCTION DECLARATIONS: Use function name() {} (not arrow functions)
+   • TYPE over interface: Use type MyType = {} (except declaration merging)
+   • @/ IMPORTS ONLY: Never use relative imports (../ or ./)
+   • ICONS COMPONENT: Use <Icons.activity /> (not direct lucide imports)
+   • CUSTOM HOOKS: Use object parameters: usePost({ id })
+   • TANSTACK START: Use createServerFn() and getWebRequest() patterns
+   • DATABASE: Use modern pgTable array syntax: (table) => [...]
+   • QUALITY: Run pnpm typecheck && pnpm lint && pnpm format
+   • REFERENCE: See CLAUDE.md for complete standards
+
+"""
+
 
 def is_dangerous_rm_command(command):
     """
@@ -24,75 +54,38 @@ def is_dangerous_rm_command(command):
     # Normalize command by removing extra spaces and converting to lowercase
     normalized = ' '.join(command.lower().split())
     
-    # Only block rm -rf targeting dangerous system paths
-    dangerous_patterns = [
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+/',          # rm -rf /
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+/\*',       # rm -rf /*
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+~',         # rm -rf ~
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+\$HOME',    # rm -rf $HOME
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+\.\.',      # rm -rf ..
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+\.',        # rm -rf . (current dir)
-        r'\brm\s+.*-[a-z]*r[a-z]*f\s+\*',        # rm -rf * (all files)
-    ]
-    
     # Check for truly dangerous patterns only
-    for pattern in dangerous_patterns:
-        if re.search(pattern, normalized):
-            return True
-    
-    return False
+    return bool(DANGEROUS_RM_RE.search(normalized))
 
 
 def is_env_file_access(tool_name, tool_input):
     """
     Check if any tool is trying to access .env files containing sensitive data.
     """
-    if tool_name in ['Read', 'Edit', 'MultiEdit', 'Write', 'Bash']:
-        # Check file paths for file-based tools
-        if tool_name in ['Read', 'Edit', 'MultiEdit', 'Write']:
-            file_path = tool_input.get('file_path', '')
-            if '.env' in file_path and not file_path.endswith('.env.sample'):
-                return True
-        
-        # Check bash commands for .env file access
-        elif tool_name == 'Bash':
-            command = tool_input.get('command', '')
-            # Pattern to detect .env file access (but allow .env.sample)
-            env_patterns = [
-                r'\b\.env\b(?!\.sample)',  # .env but not .env.sample
-                r'cat\s+.*\.env\b(?!\.sample)',  # cat .env
-                r'echo\s+.*>\s*\.env\b(?!\.sample)',  # echo > .env
-                r'touch\s+.*\.env\b(?!\.sample)',  # touch .env
-                r'cp\s+.*\.env\b(?!\.sample)',  # cp .env
-                r'mv\s+.*\.env\b(?!\.sample)',  # mv .env
-            ]
-            
-            for pattern in env_patterns:
-                if re.search(pattern, command):
-                    return True
+    # Check file paths for file-based tools
+    if tool_name in FILE_TOOLS:
+        file_path = tool_input.get('file_path', '')
+        if '.env' in file_path and not file_path.endswith('.env.sample'):
+            return True
+    
+    # Check bash commands for .env file access
+    elif tool_name == 'Bash':
+        command = tool_input.get('command', '')
+        # Every pattern needs a literal .env, so most commands never reach the regex
+        if '.env' in command and ENV_FILE_RE.search(command):
+            return True
     
     return False
 
 def remind_coding_standards(tool_name, tool_input):
     """Remind about coding standards for code-related operations"""
-    code_tools = ['Edit', 'MultiEdit', 'Write']
-    
-    if tool_name in code_tools:
+    if tool_name in CODE_TOOLS:
         file_path = tool_input.get('file_path', '')
         
         # Check if this is a TypeScript/JavaScript file
-        if file_path.endswith(('.ts', '.tsx', '.js', '.jsx')):
-            print("📝 CODING STANDARDS REMINDER:", file=sys.stderr)
-            print("   • FUNCTION DECLARATIONS: Use function name() {} (not arrow functions)", file=sys.stderr)
-            print("   • TYPE over interface: Use type MyType = {} (except declaration merging)", file=sys.stderr)
-            print("   • @/ IMPORTS ONLY: Never use relative imports (../ or ./)", file=sys.stderr)
-            print("   • ICONS COMPONENT: Use <Icons.activity /> (not direct lucide imports)", file=sys.stderr)
-            print("   • CUSTOM HOOKS: Use object parameters: usePost({ id })", file=sys.stderr)
-            print("   • TANSTACK START: Use createServerFn() and getWebRequest() patterns", file=sys.stderr)
-            print("   • DATABASE: Use modern pgTable array syntax: (table) => [...]", file=sys.stderr)
-            print("   • QUALITY: Run pnpm typecheck && pnpm lint && pnpm format", file=sys.stderr)
-            print("   • REFERENCE: See CLAUDE.md for complete standards", file=sys.stderr)
-            print("", file=sys.stderr)  # Empty line for readability
+        if file_path.endswith(CODE_EXTENSIONS):
+            # One write for the whole block (it ends with an empty line for readability)
+            sys.stderr.write(CODING_STANDARDS_REMINDER)
 
 
 def main():
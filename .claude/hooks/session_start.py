@@ -11,17 +11,25 @@ Modern SessionStart hook using cchooks SDK
 Loads project context when Claude Code starts or resumes sessions
 """
 
-import subprocess
+from __future__ import annotations
+
+import json
+import os
 import sys
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import List, Optional
 
 from cchooks import create_context, SessionStartContext
 
+# Source files listed as recently modified at startup
+CODE_EXTENSIONS = ('.ts', '.tsx', '.js', '.jsx')
+
 
 def get_git_status() -> tuple[Optional[str], Optional[int]]:
     """Get current git status information."""
+    import subprocess
+    
     try:
         # Get current branch
         branch_result = subprocess.run(
@@ -52,18 +60,29 @@ def get_git_status() -> tuple[Optional[str], Optional[int]]:
 
 def get_recently_modified_files(minutes: int = 30) -> List[str]:
     """Get recently modified files"""
-    try:
-        result = subprocess.run(
-            f"find src -type f \\( -name '*.ts' -o -name '*.tsx' -o -name '*.js' -o -name '*.jsx' \\) -mmin -{minutes} | head -10",
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        return result.stdout.strip().split('\n') if result.stdout.strip() else []
-    except Exception:
-        return []
+    cutoff = time.time() - minutes * 60
+    recent_files = []
+    
+    # Walk src directly rather than spawning a shell for find | head
+    pending = ["src"]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif (
+                        entry.name.endswith(CODE_EXTENSIONS)
+                        and entry.is_file(follow_symlinks=False)
+                        and entry.stat(follow_symlinks=False).st_mtime > cutoff
+                    ):
+                        recent_files.append(entry.path)
+                        if len(recent_files) == 10:
+                            return recent_files
+        except OSError:
+            pass
+    
+    return recent_files
 
 
 def load_development_context() -> List[str]:
@@ -77,48 +96,52 @@ def load_development_context() -> List[str]:
         if changes and changes > 0:
             context_parts.append(f"📝 Uncommitted changes: {changes} files")
     
-    # Check for active work in progress
-    work_in_progress_dir = Path(".claude/work-in-progress")
-    if work_in_progress_dir.exists():
-        wip_files = list(work_in_progress_dir.glob("*.md"))
-        if wip_files:
-            context_parts.append(f"🚧 Active work: {len(wip_files)} files in progress")
-            # Show most recently modified work file
-            if wip_files:
-                latest_work = max(wip_files, key=lambda f: f.stat().st_mtime)
-                context_parts.append(f"   📝 Latest: {latest_work.name}")
-    
-    # Check for archived work  
-    archive_dir = Path(".claude/archive")
-    if archive_dir.exists():
-        archive_files = list(archive_dir.glob("*.md"))
-        if archive_files:
-            context_parts.append(f"📦 Archived: {len(archive_files)} completed features")
+    # Check for active work in progress (a missing or unreadable directory just means no work)
+    try:
+        with os.scandir(".claude/work-in-progress") as entries:
+            wip_files = [
+                entry for entry in entries
+                if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False)
+            ]
+    except OSError:
+        wip_files = []
+    if wip_files:
+        context_parts.append(f"🚧 Active work: {len(wip_files)} files in progress")
+        # Show most recently modified work file (DirEntry caches its stat)
+        latest_work = max(wip_files, key=lambda entry: entry.stat(follow_symlinks=False).st_mtime)
+        context_parts.append(f"   📝 Latest: {latest_work.name}")
+
+    # Check for archived work
+    try:
+        with os.scandir(".claude/archive") as entries:
+            archive_count = sum(1 for entry in entries if entry.name.endswith(".md"))
+    except OSError:
+        archive_count = 0
+    if archive_count:
+        context_parts.append(f"📦 Archived: {archive_count} completed features")
     
     # Check for project configuration
     if Path("CLAUDE.md").exists():
         context_parts.append("📋 Project has CLAUDE.md configuration")
     
     # Check package.json for project type
-    if Path("package.json").exists():
-        try:
-            import json
-            with open("package.json") as f:
-                pkg_data = json.load(f)
-                if "dependencies" in pkg_data:
-                    # Detect key frameworks
-                    deps = pkg_data["dependencies"]
-                    frameworks = []
-                    if "@tanstack/react-router" in deps:
-                        frameworks.append("TanStack Router")
-                    if "react" in deps:
-                        frameworks.append("React")
-                    if "drizzle-orm" in deps:
-                        frameworks.append("Drizzle ORM")
-                    if frameworks:
-                        context_parts.append(f"🛠️ Stack: {', '.join(frameworks)}")
-        except Exception:
-            pass
+    try:
+        with open("package.json") as f:
+            pkg_data = json.load(f)
+            if "dependencies" in pkg_data:
+                # Detect key frameworks
+                deps = pkg_data["dependencies"]
+                frameworks = []
+                if "@tanstack/react-router" in deps:
+                    frameworks.append("TanStack Router")
+                if "react" in deps:
+                    frameworks.append("React")
+                if "drizzle-orm" in deps:
+                    frameworks.append("Drizzle ORM")
+                if frameworks:
+                    context_parts.append(f"🛠️ Stack: {', '.join(frameworks)}")
+    except Exception:
+        pass
     
     return context_parts
 
@@ -137,35 +160,37 @@ def main():
             context.output.exit_success()
             return
         
+        # Collect output and emit it with a single write
+        lines = []
+
         # Handle different session start types
         if context.source == "resume":
             # Load previous work context
             # Previous context now provided by cchooks automatically
-            print(f"\n🔄 Resuming session (context provided by cchooks)", file=sys.stderr)
+            lines.append("\n🔄 Resuming session (context provided by cchooks)")
         
         elif context.source == "startup":
-            print("\n🚀 Starting new Claude Code session", file=sys.stderr)
+            lines.append("\n🚀 Starting new Claude Code session")
             
             # Show recently modified files for context
             recent_files = get_recently_modified_files(60)  # Last hour
             if recent_files:
-                print("📂 Recently modified files:", file=sys.stderr)
-                for file_path in recent_files[:5]:
-                    print(f"   - {file_path}", file=sys.stderr)
+                lines.append("📂 Recently modified files:")
+                lines.extend(f"   - {file_path}" for file_path in recent_files[:5])
         
         elif context.source == "clear":
-            print("\n🧹 Starting fresh session (history cleared)", file=sys.stderr)
+            lines.append("\n🧹 Starting fresh session (history cleared)")
         
         # Show development context for all session types
         context_parts = load_development_context()
         if context_parts:
-            print("\n📋 Development Context:", file=sys.stderr)
-            for part in context_parts:
-                print(f"   {part}", file=sys.stderr)
+            lines.append("\n📋 Development Context:")
+            lines.extend(f"   {part}" for part in context_parts)
         
         # Subagent stats now tracked by cchooks automatically
         
-        print("", file=sys.stderr)  # Add spacing
+        lines.append("")  # Add spacing
+        sys.stderr.write("\n".join(lines) + "\n")
         
         # Always exit with success - output is added to session context
         context.output.exit_success()
@@ -11,12 +11,24 @@ Modern Stop hook using cchooks SDK
 Provides session summary with git status and quality checks
 """
 
+import os
+import signal
 import subprocess
 import sys
+import time
 from datetime import datetime 
 from pathlib import Path
 from cchooks import create_context, StopContext
 
+# Resolved once at import so log_debug doesn't read the environment per call
+DEBUG = os.getenv("CLAUDE_HOOKS_DEBUG", "0") == "1"
+
+
+def log_debug(message):
+    """Print a debug message to stderr when CLAUDE_HOOKS_DEBUG=1."""
+    if DEBUG:
+        print(f"🐛 {message}", file=sys.stderr)
+
 
 def get_git_status():
     """Get current git changes for session summary."""
@@ -35,38 +47,56 @@ def get_git_status():
     except Exception:
         return 0, []
 
+# Final project-wide checks: (command, timeout in seconds, issue reported on failure).
+# Stages run in order and the checks within a stage run together; the build comes
+# first because it regenerates src/routeTree.gen.ts, which tsc then reads
+FINAL_QUALITY_STAGES = [
+    [
+        (['pnpm', 'build'], 30, "Build failed"),
+    ],
+    [
+        (['pnpm', 'typecheck'], 15, "TypeScript errors"),
+        (['pnpm', 'lint'], 15, "Linting errors"),
+    ],
+]
+
 def run_final_quality_check():
     """Run final project-wide quality checks."""
     log_debug("Running final quality checks")
     checks_passed = True
     issues = []
 
-    try:
-        # Check if build passes
-        result = subprocess.run(['pnpm', 'build'], capture_output=True, timeout=30)
-        if result.returncode != 0:
-            checks_passed = False
-            issues.append("Build failed")
-    except Exception:
-        pass
-
-    try:
-        # Check TypeScript
-        result = subprocess.run(['pnpm', 'typecheck'], capture_output=True, timeout=15)
-        if result.returncode != 0:
-            checks_passed = False
-            issues.append("TypeScript errors")
-    except Exception:
-        pass
-
-    try:
-        # Check linting
-        result = subprocess.run(['pnpm', 'lint'], capture_output=True, timeout=15)
-        if result.returncode != 0:
-            checks_passed = False
-            issues.append("Linting errors")
-    except Exception:
-        pass
+    for stage in FINAL_QUALITY_STAGES:
+        # Checks in a stage are independent, so start them all before waiting on any
+        started = time.monotonic()
+        running = []
+        for command, timeout, issue in stage:
+            try:
+                # Own session per check, so a timeout can kill the tool pnpm spawned too
+                process = subprocess.Popen(
+                    command,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    start_new_session=True
+                )
+            except Exception:
+                continue
+            running.append((process, started + timeout, issue))
+
+        for process, deadline, issue in running:
+            try:
+                if process.wait(timeout=max(0, deadline - time.monotonic())) != 0:
+                    checks_passed = False
+                    issues.append(issue)
+            except subprocess.TimeoutExpired:
+                try:
+                    os.killpg(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+                process.wait()
+                # A check that didn't finish hasn't passed
+                checks_passed = False
+                issues.append(f"{issue} (timed out)")
 
     return checks_passed, issues
 
@@ -77,8 +107,9 @@ def generate_session_summary():
     # Get git status
     change_count, changed_files = get_git_status()
 
-    # Run quality checks
-    quality_passed, quality_issues = run_final_quality_check()
+    # Run quality checks only when the working tree has changes to check
+    if change_count:
+        quality_passed, quality_issues = run_final_quality_check()
 
     summary = [
         f"Claude Code session completed at {timestamp}",
@@ -90,7 +121,9 @@ def generate_session_summary():
         for file in changed_files:
             summary.append(f"  {file}")
 
-    if quality_passed:
+    if not change_count:
+        summary.append("⏭️  No uncommitted changes - quality checks skipped")
+    elif quality_passed:
         summary.append("✅ All quality checks passed")
     else:
         summary.append("⚠️  Quality issues detected:")
@@ -11,6 +11,7 @@ Modern UserPromptSubmit hook using cchooks SDK
 Provides context injection, prompt validation, and subagent suggestions
 """
 
+import json
 import re
 import sys
 from datetime import datetime
@@ -19,6 +20,36 @@ from typing import List, Optional
 
 from cchooks import create_context, UserPromptSubmitContext
 
+# File reference patterns (run separately so one pattern's keyword can't hide another's match)
+FILE_REFERENCE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:file|in|from|edit|update|modify|create)\s+([a-zA-Z0-9_/-]+\.[a-zA-Z0-9]+)',
+        r'([a-zA-Z0-9_/-]+\.[a-zA-Z0-9]+)\s+(?:file|component)',
+        r'`([a-zA-Z0-9_/-]+\.[a-zA-Z0-9]+)`',
+    )
+)
+
+# Component/function reference patterns
+COMPONENT_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'(?:component|function|class)\s+([A-Z][a-zA-Z0-9]+)',
+        r'([A-Z][a-zA-Z0-9]+)\s+(?:component|function|class)',
+        r'`([A-Z][a-zA-Z0-9]+)`',
+    )
+)
+
+# Prompts that are nothing but a vague request
+VAGUE_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'^(help|fix|create|make|do)\s*$',
+        r'^(how do i|can you|please)\s*$',
+        r'^(i want|i need)\s*$',
+    )
+)
+
 
 def suggest_subagent(prompt: str) -> Optional[str]:
     """Check if prompt might benefit from a subagent"""
@@ -55,15 +86,12 @@ def extract_context_hints(prompt: str) -> List[str]:
     """Extract context hints from the prompt"""
     hints = []
 
-    # Look for file references
-    file_patterns = [
-        r'(?:file|in|from|edit|update|modify|create)\s+([a-zA-Z0-9_/-]+\.[a-zA-Z0-9]+)',
-        r'([a-zA-Z0-9_/-]+\.[a-zA-Z0-9]+)\s+(?:file|component)',
-        r'`([a-zA-Z0-9_/-]+\.[a-zA-Z0-9]+)`',
-    ]
-
-    for pattern in file_patterns:
-        matches = re.findall(pattern, prompt, re.IGNORECASE)
+    # Look for file references (every pattern needs a dot, so skip the scans without one)
+    if "." in prompt:
+        # dict keeps first-seen order while deduplicating
+        matches = dict.fromkeys(
+            match for pattern in FILE_REFERENCE_PATTERNS for match in pattern.findall(prompt)
+        )
         for match in matches:
             if Path(match).exists():
                 hints.append(f"📄 Referenced file exists: {match}")
@@ -71,15 +99,8 @@ def extract_context_hints(prompt: str) -> List[str]:
                 hints.append(f"📄 Referenced file: {match} (not found)")
 
     # Look for component/function references
-    component_patterns = [
-        r'(?:component|function|class)\s+([A-Z][a-zA-Z0-9]+)',
-        r'([A-Z][a-zA-Z0-9]+)\s+(?:component|function|class)',
-        r'`([A-Z][a-zA-Z0-9]+)`',
-    ]
-
-    for pattern in component_patterns:
-        matches = re.findall(pattern, prompt, re.IGNORECASE)
-        for match in matches:
+    for pattern in COMPONENT_PATTERNS:
+        for match in pattern.findall(prompt):
             hints.append(f"🧩 Component/Function reference: {match}")
 
     # Look for technology mentions
@@ -94,8 +115,9 @@ def extract_context_hints(prompt: str) -> List[str]:
         'resend': '📧 Resend'
     }
 
+    prompt_lower = prompt.lower()
     for keyword, icon in tech_keywords.items():
-        if keyword in prompt.lower():
+        if keyword in prompt_lower:
             hints.append(f"{icon} technology mentioned")
 
     return hints
@@ -104,25 +126,21 @@ def extract_context_hints(prompt: str) -> List[str]:
 def check_prompt_quality(prompt: str) -> List[str]:
     """Check prompt quality and provide suggestions"""
     issues = []
+    stripped = prompt.strip()
+    prompt_lower = prompt.lower()
 
     # Check if prompt is too short
-    if len(prompt.strip()) < 10:
+    if len(stripped) < 10:
         issues.append("⚠️ Prompt seems very short - consider adding more context")
 
     # Check for vague requests
-    vague_patterns = [
-        r'^(help|fix|create|make|do)\s*$',
-        r'^(how do i|can you|please)\s*$',
-        r'^(i want|i need)\s*$'
-    ]
-
-    for pattern in vague_patterns:
-        if re.match(pattern, prompt.strip(), re.IGNORECASE):
+    for pattern in VAGUE_PATTERNS:
+        if pattern.match(stripped):
             issues.append("💡 Consider being more specific about what you want to achieve")
             break
 
     # Check for missing context clues
-    if not any(keyword in prompt.lower() for keyword in ['file', 'component', 'function', 'feature', 'bug', 'error']):
+    if not any(keyword in prompt_lower for keyword in ['file', 'component', 'function', 'feature', 'bug', 'error']):
         if len(prompt.split()) > 3:  # Only for longer prompts
             issues.append("💡 Consider mentioning specific files or components")
 
@@ -176,7 +194,6 @@ def inject_project_context(prompt: str) -> str:
         post_tool_log = logs_dir / "post_tool_use.json"
         if post_tool_log.exists():
             try:
-                import json
                 with open(post_tool_log) as f:
                     log_data = json.load(f)
                     if log_data and isinstance(log_data, list):
@@ -230,16 +247,7 @@ def main():
         # Log the prompt for debugging/analytics
         log_dir = Path(".claude/logs")
         log_dir.mkdir(exist_ok=True)
-        log_path = log_dir / "user_prompt_submit.json"
-
-        try:
-            if log_path.exists():
-                with open(log_path) as f:
-                    log_data = json.load(f)
-            else:
-                log_data = []
-        except:
-            log_data = []
+        log_path = log_dir / "user_prompt_submit.jsonl"
 
         log_entry = {
             "timestamp": datetime.now().isoformat(),
@@ -247,11 +255,10 @@ def main():
             "prompt_length": len(prompt),
             "word_count": len(prompt.split())
         }
-        log_data.append(log_entry)
 
-        with open(log_path, 'w') as f:
-            import json
-            json.dump(log_data, f, indent=2)
+        # Append one JSON object per line instead of rewriting the whole history
+        with open(log_path, 'a') as f:
+            f.write(json.dumps(log_entry, separators=(",", ":")) + "\n")
 
         # Check for subagent suggestions
         suggested_agent = suggest_subagent(prompt)